@@ -3,7 +3,7 @@
 Run with -h for usage information.
 """
 import argparse
-from scipy.special import binom, factorial
+from math import comb, factorial
 
 # Parse command line arguments
 parser = argparse.ArgumentParser(description="Calculates the number of partitions of a set with N elements into K subsets (i.e. the Stirling number of the second kind)")
@@ -13,4 +13,4 @@ args = parser.parse_args()
 
 (n, k) = (args.n, args.k)
 
-print(sum([(-1)**i * binom(k, i) * (k - i)**n for i in range(k+1)]) / factorial(k))
+print(sum([(-1)**i * comb(k, i) * (k - i)**n for i in range(k+1)]) // factorial(k))
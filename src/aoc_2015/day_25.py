@@ -3,7 +3,6 @@
 Run with -h for usage information.
 """
 import argparse
-import itertools as it
 
 # Parse command line arguments
 parser = argparse.ArgumentParser(description="Tests modulo arithmetic compared with separate steps.")
@@ -22,11 +21,13 @@ def steps(n) :
     return x
 
 def modulo(n) :
-    return (m**n * init) % p
+    return (pow(m, n, p) * init) % p
 
 print(steps(args.n), modulo(args.n))
 
 """
+import itertools as it
+
 for n in it.count() :
     x = modulo(n)
     if x in vals :